@@ -1,9 +1,15 @@
 import os
+from functools import lru_cache
+from io import BytesIO
+from typing import Optional
+import orjson
 import uvicorn
-from fastapi import FastAPI, Body, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import FastAPI, Body, HTTPException, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from anyio import to_thread
 from dotenv import load_dotenv
+from pydantic import BaseModel
 
 from services.ai_service import AIService
 from services.doc_service import generate_doc
@@ -15,7 +21,8 @@ load_dotenv()
 app = FastAPI(
     title="Meeting Transcript Processor",
     description="Convert meeting transcripts into structured minutes using AI",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Initialize AI service with error handling
@@ -34,11 +41,58 @@ app.add_middleware(
     allow_headers=["Content-Type", "Authorization"],  # Specific headers
 )
 
+class MinutesIn(BaseModel):
+    """Request body for /api/ai-minutes"""
+    transcript: Optional[str] = None
+
+def _iter_buf(buf: BytesIO, size: int = 65536):
+    """Yield a rendered document in fixed-size chunks without copying it whole"""
+    buf.seek(0)
+    while True:
+        data = buf.read(size)
+        if not data:
+            break
+        yield data
+
+def _payload_key(data: dict) -> Optional[bytes]:
+    """Canonical serialization of a minutes payload, used as the render cache key.
+    
+    Returns None when the payload must not be cached: without processed_at the
+    renderers stamp the current time, orjson rejects ints beyond 64 bits, and
+    NaN/Infinity serialize as null, so the cached render would differ.
+    """
+    if 'processed_at' not in data:
+        return None
+    try:
+        blob = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError:
+        return None
+    # The cached renderers rebuild the payload from the blob, so it must round-trip
+    if orjson.loads(blob) != data:
+        return None
+    return blob
+
+# Clients usually fetch DOCX and PDF for the same minutes, and retry; cache per worker
+@lru_cache(maxsize=64)
+def _render_doc(blob: bytes) -> bytes:
+    """Render DOCX bytes for a serialized payload"""
+    return generate_doc(orjson.loads(blob)).getvalue()
+
+@lru_cache(maxsize=64)
+def _render_pdf(blob: bytes) -> bytes:
+    """Render PDF bytes for a serialized payload"""
+    return generate_pdf(orjson.loads(blob)).getvalue()
+
+@app.on_event("startup")
+async def grow_threadpool():
+    """Allow more concurrent document renders on the anyio threadpool"""
+    to_thread.current_default_thread_limiter().total_tokens = 64
+
 @app.post("/api/ai-minutes")
-async def ai_minutes(payload: dict = Body(...)):
+async def ai_minutes(payload: MinutesIn) -> Response:
     """Process meeting transcript and return structured minutes"""
     try:
-        transcript = payload.get("transcript", "")
+        transcript = payload.transcript
         
         if not transcript or not transcript.strip():
             raise HTTPException(status_code=400, detail="Transcript is required and cannot be empty")
@@ -48,7 +102,8 @@ async def ai_minutes(payload: dict = Body(...)):
         
         # Process transcript
         structured = await ai_service.process_transcript(transcript)
-        return structured
+        # Already JSON-safe, so serialize once and skip FastAPI's response handling
+        return Response(content=orjson.dumps(structured), media_type="application/json")
         
     except HTTPException:
         raise
@@ -58,27 +113,36 @@ async def ai_minutes(payload: dict = Body(...)):
 
 @app.get("/api/health")
 async def health_check():
-    """Health check endpoint"""
+    """Health check endpoint: empty 204 when healthy, details with 503 otherwise"""
     if not ai_service:
-        return {
+        return ORJSONResponse({
             "status": "unhealthy",
             "error": "AI service not initialized",
             "timestamp": None
-        }
-    return ai_service.health_check()
+        }, status_code=503)
+    health = ai_service.health_check()
+    if health['status'] == 'healthy':
+        return Response(status_code=204)
+    return ORJSONResponse(health, status_code=503)
 
+# Document routes are sync so FastAPI runs the blocking renderers on the threadpool
 @app.post("/api/generate-doc")
-async def generate_docx(data: dict = Body(...)):
+def generate_docx(data: dict = Body(...)):
     """Generate DOCX document from structured meeting data"""
     try:
         if not data:
             raise HTTPException(status_code=400, detail="Meeting data is required")
         
-        buf = generate_doc(data)
+        key = _payload_key(data)
+        content = _render_doc(key) if key is not None else generate_doc(data).getvalue()
         return StreamingResponse(
-            iter([buf.getvalue()]),
+            _iter_buf(BytesIO(content)),
             media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            headers={"Content-Disposition": "attachment; filename=meeting_minutes.docx"},
+            headers={
+                "Content-Disposition": "attachment; filename=meeting_minutes.docx",
+                "Content-Length": str(len(content)),
+                "X-Accel-Buffering": "no",
+            },
         )
         
     except Exception as e:
@@ -86,17 +150,22 @@ async def generate_docx(data: dict = Body(...)):
         raise HTTPException(status_code=500, detail=f"Failed to generate document: {str(e)}")
 
 @app.post("/api/generate-pdf")
-async def generate_pdfx(data: dict = Body(...)):
+def generate_pdfx(data: dict = Body(...)):
     """Generate PDF document from structured meeting data"""
     try:
         if not data:
             raise HTTPException(status_code=400, detail="Meeting data is required")
         
-        buf = generate_pdf(data)
+        key = _payload_key(data)
+        content = _render_pdf(key) if key is not None else generate_pdf(data).getvalue()
         return StreamingResponse(
-            iter([buf.getvalue()]),
+            _iter_buf(BytesIO(content)),
             media_type="application/pdf",
-            headers={"Content-Disposition": "attachment; filename=meeting_minutes.pdf"},
+            headers={
+                "Content-Disposition": "attachment; filename=meeting_minutes.pdf",
+                "Content-Length": str(len(content)),
+                "X-Accel-Buffering": "no",
+            },
         )
         
     except Exception as e:
@@ -107,11 +176,24 @@ if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
     host = os.environ.get("HOST", "0.0.0.0")
     
+    if os.environ.get("ENV") == "dev":
+        # Auto-reload only works with a single worker
+        run_options = {"reload": True, "workers": 1}
+    else:
+        run_options = {
+            "workers": int(os.environ.get("UVICORN_WORKERS", "4")),
+            "limit_concurrency": 1024,
+            "backlog": 2048,
+        }
+    
     uvicorn.run(
         "server:app", 
         host=host, 
         port=port, 
-        reload=True,
-        log_level="info",
-        access_log=True
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+        # Access logging costs a formatted log line per request; opt in with ACCESS_LOG=1
+        access_log=os.environ.get("ACCESS_LOG", "0") == "1",
+        **run_options
     )
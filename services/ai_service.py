@@ -1,36 +1,129 @@
 import os
 import re
+import uuid
 import asyncio
+import threading
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dotenv import load_dotenv
 from emergentintegrations.llm.chat import LlmChat, UserMessage
 
+# Prefer orjson's C parser for model responses, falling back to the stdlib
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+_loads = _json.loads
+
+# Optional hyperscan DFA used to pre-filter long transcripts for action items
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 # Load environment variables
 load_dotenv()
 
-class AIService:
-    """High-performance AI service using OpenAI via Emergent LLM integration"""
+# Fallback extraction patterns, compiled once and applied in a single pass each
+_PARTICIPANT_RE = re.compile(
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)(?::|\s+(?:said|mentioned|noted|stated))'
+)
+_ACTION_RE = re.compile(
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:will|should|needs to|must|agreed to|committed to)\s+(.+?)(?=\.|\n|$)',
+    re.IGNORECASE
+)
+
+# Shorter transcripts are cheap enough to scan with _ACTION_RE directly
+_HYPERSCAN_MIN_LENGTH = 20_000
+
+_ACTION_KEYWORDS = ('will', 'should', 'needs to', 'must', 'agreed to', 'committed to')
+
+# Non-ASCII characters Unicode IGNORECASE folds onto keyword letters;
+# HS_FLAG_CASELESS only folds ASCII, so these are spelled out in the pattern
+_KEYWORD_FOLDS = {'i': '\u0130\u0131', 's': '\u017f'}
+
+def _keyword_pattern() -> bytes:
+    """Build a byte-level hyperscan pattern matching every keyword _ACTION_RE accepts"""
+    alternatives = []
+    for keyword in _ACTION_KEYWORDS:
+        parts = []
+        for char in keyword:
+            folds = _KEYWORD_FOLDS.get(char)
+            if folds:
+                variants = [char.encode()] + [
+                    ''.join(f'\\x{b:02x}' for b in fold.encode('utf-8')).encode()
+                    for fold in folds
+                ]
+                parts.append(b'(?:' + b'|'.join(variants) + b')')
+            else:
+                parts.append(char.encode())
+        alternatives.append(b''.join(parts))
+    return b'|'.join(alternatives)
+
+if hyperscan is not None:
+    _ACTION_KEYWORD_DB = hyperscan.Database()
+    _ACTION_KEYWORD_DB.compile(
+        expressions=[_keyword_pattern()],
+        ids=[0],
+        elements=1,
+        flags=[hyperscan.HS_FLAG_CASELESS]
+    )
+    # The database owns a single scratch space, so scans must not overlap
+    _ACTION_KEYWORD_LOCK = threading.Lock()
+
+def _is_break(data: bytes, i: int) -> bool:
+    """A '.' after a printable non-space ASCII byte can never fall inside an _ACTION_RE match.
     
-    def __init__(self):
-        self.api_key = os.environ.get('EMERGENT_LLM_KEY')
-        if not self.api_key:
-            raise ValueError("EMERGENT_LLM_KEY not found in environment variables")
-            
-        # Use GPT-4o-mini for optimal performance and cost
-        self.model_name = "gpt-4o-mini"
-        self.provider = "openai"
-        
-        # Initialize chat client with optimized settings
-        self.chat_client = LlmChat(
-            api_key=self.api_key,
-            session_id="meeting-transcript-processor",
-            system_message=self._get_system_prompt()
-        ).with_model(self.provider, self.model_name)
-        
-    def _get_system_prompt(self) -> str:
-        """Optimized system prompt for meeting transcript processing"""
-        return """
+    Owners and keywords are letters and whitespace, and a task only contains a
+    '.' as its first character, right after whitespace. Non-ASCII letters and
+    whitespace encode to bytes >= 0x80, so they never count as a break.
+    """
+    return i == 0 or 0x21 <= data[i - 1] <= 0x7e
+
+def _action_candidate_segments(transcript: str) -> List[str]:
+    """Return the segments of the transcript, split at breaks, that contain an action keyword"""
+    # surrogatepass keeps lone surrogates (valid in JSON bodies) as non-ASCII bytes
+    data = transcript.encode('utf-8', 'surrogatepass')
+    ends = []
+    
+    def on_match(expr_id, start, end, flags, context):
+        ends.append(end)
+    
+    with _ACTION_KEYWORD_LOCK:
+        _ACTION_KEYWORD_DB.scan(data, match_event_handler=on_match)
+    
+    # Hits arrive ordered by end offset; keep one segment per run of hits
+    segments = []
+    seg_end = -1
+    for end in ends:
+        if end <= seg_end:
+            continue
+        seg_start = data.rfind(b'.', 0, end)
+        while seg_start > 0 and not _is_break(data, seg_start):
+            seg_start = data.rfind(b'.', 0, seg_start)
+        seg_end = data.find(b'.', end)
+        while seg_end != -1 and not _is_break(data, seg_end):
+            seg_end = data.find(b'.', seg_end + 1)
+        if seg_end == -1:
+            seg_end = len(data)
+        segments.append(data[seg_start + 1:seg_end].decode('utf-8', 'surrogatepass'))
+    
+    return segments
+
+# Words the model (or the regex fallback) sometimes reports as participant names
+_JUNK_WORDS = frozenset({
+    'date', 'time', 'meeting', 'call', 'team', 'group', 'project', 
+    'need', 'will', 'can', 'should', 'would', 'discussion', 'agenda',
+    'minutes', 'action', 'item', 'decision', 'summary', 'everyone',
+    'all', 'we', 'us', 'they', 'them', 'it', 'this', 'that'
+})
+_URL_PREFIXES = ('http', 'www', '@')
+
+# Markdown code fence the model sometimes wraps its JSON in
+_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*(.*?)\s*```\s*$', re.S)
+
+# System prompt for meeting transcript processing, shared by every AIService
+_SYSTEM_PROMPT = """
 You are an expert meeting minutes processor. Your task is to analyze meeting transcripts and extract structured information with high accuracy.
 
 You must return a JSON response with exactly these fields:
@@ -45,7 +138,42 @@ You must return a JSON response with exactly these fields:
 
 Be precise and only extract what's clearly present in the transcript. For action items, extract only clear commitments with owners.
 """
+
+# Fixed text around the transcript in each user prompt
+_PROMPT_HEAD = """
+Analyze this meeting transcript and extract structured information:
+
+"""
+_PROMPT_TAIL = """
+
+Return the result as a JSON object with the required fields. Ensure:
+- Participants are real names only (no junk words)
+- Action items have clear owners and tasks
+- Decisions are confirmed commitments, not discussions
+- Topics include confidence scores
+- Summary is concise bullet points
+"""
+
+class AIService:
+    """High-performance AI service using OpenAI via Emergent LLM integration"""
     
+    def __init__(self):
+        self.api_key = os.environ.get('EMERGENT_LLM_KEY')
+        if not self.api_key:
+            raise ValueError("EMERGENT_LLM_KEY not found in environment variables")
+            
+        # Use GPT-4o-mini for optimal performance and cost
+        self.model_name = "gpt-4o-mini"
+        self.provider = "openai"
+        
+    def _new_chat(self) -> LlmChat:
+        """Create a chat client with a fresh session so no prior turns are resent"""
+        return LlmChat(
+            api_key=self.api_key,
+            session_id=f"mt-{uuid.uuid4()}",
+            system_message=_SYSTEM_PROMPT
+        ).with_model(self.provider, self.model_name)
+        
     async def process_transcript(self, transcript: str) -> Dict[str, Any]:
         """Process meeting transcript with AI and fallback mechanisms"""
         try:
@@ -53,7 +181,7 @@ Be precise and only extract what's clearly present in the transcript. For action
             result = await self._ai_process(transcript)
             
             # Validate and enhance with fallback if needed
-            validated_result = self._validate_and_enhance(result, transcript)
+            validated_result = await self._validate_and_enhance(result, transcript)
             
             return validated_result
             
@@ -64,33 +192,18 @@ Be precise and only extract what's clearly present in the transcript. For action
     
     async def _ai_process(self, transcript: str) -> Dict[str, Any]:
         """Primary AI processing using OpenAI"""
-        prompt = f"""
-Analyze this meeting transcript and extract structured information:
-
-{transcript}
-
-Return the result as a JSON object with the required fields. Ensure:
-- Participants are real names only (no junk words)
-- Action items have clear owners and tasks
-- Decisions are confirmed commitments, not discussions
-- Topics include confidence scores
-- Summary is concise bullet points
-"""
+        prompt = _PROMPT_HEAD + transcript + _PROMPT_TAIL
         
         user_message = UserMessage(text=prompt)
-        response = await self.chat_client.send_message(user_message)
+        response = await self._new_chat().send_message(user_message)
         
         # Parse JSON response
-        import json
         try:
             # Extract JSON from response if wrapped in markdown
-            response_text = response.strip()
-            if response_text.startswith('```json'):
-                response_text = response_text[7:]
-            if response_text.endswith('```'):
-                response_text = response_text[:-3]
+            match = _FENCE_RE.match(response)
+            payload = match.group(1) if match else response
             
-            result = json.loads(response_text.strip())
+            result = _loads(payload)
             
             # Add metadata
             result['processed_at'] = datetime.utcnow().isoformat()
@@ -98,12 +211,12 @@ Return the result as a JSON object with the required fields. Ensure:
             
             return result
             
-        except json.JSONDecodeError as e:
+        except _json.JSONDecodeError as e:
             print(f"JSON parsing failed: {e}")
             print(f"Response: {response}")
             raise
     
-    def _validate_and_enhance(self, result: Dict[str, Any], transcript: str) -> Dict[str, Any]:
+    async def _validate_and_enhance(self, result: Dict[str, Any], transcript: str) -> Dict[str, Any]:
         """Validate AI results and enhance with fallback processing"""
         # Ensure all required fields exist
         required_fields = ['summary', 'decisions', 'agenda', 'participants', 'topics', 'actionItems']
@@ -115,86 +228,72 @@ Return the result as a JSON object with the required fields. Ensure:
         if result['participants']:
             result['participants'] = self._clean_participants(result['participants'])
         
-        # If critical fields are empty, try fallback extraction
+        # If critical fields are empty, try fallback extraction off the event loop
         if not result['participants']:
-            result['participants'] = self._extract_participants_fallback(transcript)
+            result['participants'] = await asyncio.to_thread(self._extract_participants_fallback, transcript)
         
         if not result['actionItems']:
-            result['actionItems'] = self._extract_action_items_fallback(transcript)
+            result['actionItems'] = await asyncio.to_thread(self._extract_action_items_fallback, transcript)
         
         return result
     
     def _clean_participants(self, participants: List[str]) -> List[str]:
         """Clean participant list, removing junk and duplicates"""
-        junk_words = {
-            'date', 'time', 'meeting', 'call', 'team', 'group', 'project', 
-            'need', 'will', 'can', 'should', 'would', 'discussion', 'agenda',
-            'minutes', 'action', 'item', 'decision', 'summary', 'everyone',
-            'all', 'we', 'us', 'they', 'them', 'it', 'this', 'that'
-        }
-        
-        cleaned = []
-        for participant in participants:
-            participant = participant.strip()
-            # Must be 2+ chars, start with capital, and not in junk words
-            if (len(participant) >= 2 and 
-                participant[0].isupper() and 
-                participant.lower() not in junk_words and
-                not participant.lower().startswith(('http', 'www', '@'))):
-                cleaned.append(participant)
-        
-        # Remove duplicates while preserving order
-        return list(dict.fromkeys(cleaned))
+        stripped = [p.strip() for p in participants]
+        # Must be 2+ chars, start with capital, and not junk; dict.fromkeys dedupes in order
+        return list(dict.fromkeys(
+            p for p in stripped
+            if len(p) >= 2
+            and p[0].isupper()
+            and p.lower() not in _JUNK_WORDS
+            and not p.lower().startswith(_URL_PREFIXES)
+        ))
     
     def _extract_participants_fallback(self, transcript: str) -> List[str]:
         """Extract participants using regex fallback"""
         # Look for patterns like "Name:" or "Name said" or "Name mentioned"
-        patterns = [
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*):',  # Name: format
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:said|mentioned|noted|stated)',  # Name said format
-        ]
-        
-        participants = set()
-        for pattern in patterns:
-            matches = re.findall(pattern, transcript)
-            participants.update(matches)
+        participants = set(_PARTICIPANT_RE.findall(transcript))
         
         return self._clean_participants(list(participants))
     
     def _extract_action_items_fallback(self, transcript: str) -> List[Dict[str, Any]]:
         """Extract action items using regex fallback"""
-        action_patterns = [
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:will|should|needs to|must)\s+(.+?)(?=\.|\n|$)',
-            r'Action item[^:]*:\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:will|should|needs to|must)\s+(.+?)(?=\.|\n|$)',
-            r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:agreed to|committed to)\s+(.+?)(?=\.|\n|$)'
-        ]
+        if hyperscan is not None and len(transcript) > _HYPERSCAN_MIN_LENGTH:
+            matches = [
+                match
+                for segment in _action_candidate_segments(transcript)
+                for match in _ACTION_RE.findall(segment)
+            ]
+        else:
+            matches = _ACTION_RE.findall(transcript)
         
-        action_items = []
-        for pattern in action_patterns:
-            matches = re.findall(pattern, transcript, re.IGNORECASE)
-            for match in matches:
-                if len(match) == 2:
-                    owner, task = match
-                    action_items.append({
-                        'task': task.strip(),
-                        'owner': owner.strip(),
-                        'deadline': 'Not specified',
-                        'status': 'Pending'
-                    })
-        
-        return action_items
+        return [
+            {
+                'task': task.strip(),
+                'owner': owner.strip(),
+                'deadline': 'Not specified',
+                'status': 'Pending'
+            }
+            for owner, task in matches
+        ]
     
     async def _fallback_process(self, transcript: str) -> Dict[str, Any]:
         """Fallback processing when AI fails"""
         print("Using fallback processing...")
         
+        # The two scans are independent, so run them concurrently off the event loop
+        participants, action_items = await asyncio.gather(
+            asyncio.to_thread(self._extract_participants_fallback, transcript),
+            asyncio.to_thread(self._extract_action_items_fallback, transcript)
+        )
+        
         return {
             'summary': ["Meeting transcript processed with fallback method", "AI processing temporarily unavailable"],
             'decisions': [],
             'agenda': ["General discussion"],
-            'participants': self._extract_participants_fallback(transcript),
+            'participants': participants,
             'topics': [{'topic': 'General meeting discussion', 'confidence': 0.7}],
-            'actionItems': self._extract_action_items_fallback(transcript),
+            'actionItems': action_items,
             'processed_at': datetime.utcnow().isoformat(),
             'model_used': 'fallback/regex'
         }
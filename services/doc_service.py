@@ -1,8 +1,44 @@
+import re
 from io import BytesIO
+from xml.sax.saxutils import escape
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
 from typing import Dict, Any, List
 from datetime import datetime
 
+# Tabs and line breaks become <w:tab/>/<w:br/> elements, as python-docx's run.text does
+_RUN_SPLIT_RE = re.compile(r'([\t\r\n])')
+
+def _paragraph_xml(text: str) -> str:
+    """Build the same w:p markup doc.add_paragraph(text) would produce"""
+    if not text:
+        return '<w:p/>'
+    parts = []
+    for piece in _RUN_SPLIT_RE.split(text):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece == '\r' or piece == '\n':
+            parts.append('<w:br/>')
+        elif piece:
+            space = ' xml:space="preserve"' if len(piece.strip()) < len(piece) else ''
+            parts.append(f'<w:t{space}>{escape(piece)}</w:t>')
+    return f'<w:p><w:r>{"".join(parts)}</w:r></w:p>'
+
+def _append_paragraphs(doc: Document, lines: List[str]) -> None:
+    """Append plain paragraphs (plus a trailing empty line) as one XML fragment"""
+    paragraphs = "".join(_paragraph_xml(line) for line in lines)
+    fragment = parse_xml(f'<w:body {nsdecls("w")}>{paragraphs}<w:p/></w:body>')
+    
+    # Section properties must stay the last child of the body
+    body = doc.element.body
+    sect_pr = body.sectPr
+    if sect_pr is not None:
+        body.remove(sect_pr)
+    body.extend(fragment)
+    if sect_pr is not None:
+        body.append(sect_pr)
+
 def generate_doc(data: Dict[str, Any]) -> BytesIO:
     """Generate DOCX document from structured meeting data"""
     doc = Document()
@@ -23,49 +59,42 @@ def generate_doc(data: Dict[str, Any]) -> BytesIO:
     participants = data.get('participants', [])
     if participants:
         doc.add_heading('Participants', level=1)
-        for participant in participants:
-            doc.add_paragraph(f"• {participant}")
-        doc.add_paragraph("")  # Empty line
+        _append_paragraphs(doc, [f"• {participant}" for participant in participants])
     
     # Summary
     summary = data.get('summary', [])
     if summary:
         doc.add_heading('Summary', level=1)
         if isinstance(summary, list):
-            for point in summary:
-                doc.add_paragraph(f"• {point}")
+            _append_paragraphs(doc, [f"• {point}" for point in summary])
         else:
-            doc.add_paragraph(str(summary))
-        doc.add_paragraph("")  # Empty line
+            _append_paragraphs(doc, [str(summary)])
     
     # Agenda Items
     agenda = data.get('agenda', [])
     if agenda:
         doc.add_heading('Agenda Items', level=1)
-        for item in agenda:
-            doc.add_paragraph(f"• {item}")
-        doc.add_paragraph("")  # Empty line
+        _append_paragraphs(doc, [f"• {item}" for item in agenda])
     
     # Topics Discussed
     topics = data.get('topics', [])
     if topics:
         doc.add_heading('Topics Discussed', level=1)
+        lines = []
         for topic in topics:
             if isinstance(topic, dict):
                 topic_name = topic.get('topic', '')
                 confidence = topic.get('confidence', 0)
-                doc.add_paragraph(f"• {topic_name} (Confidence: {confidence:.1%})")
+                lines.append(f"• {topic_name} (Confidence: {confidence:.1%})")
             else:
-                doc.add_paragraph(f"• {topic}")
-        doc.add_paragraph("")  # Empty line
+                lines.append(f"• {topic}")
+        _append_paragraphs(doc, lines)
     
     # Decisions Made
     decisions = data.get('decisions', [])
     if decisions:
         doc.add_heading('Decisions Made', level=1)
-        for decision in decisions:
-            doc.add_paragraph(f"• {decision}")
-        doc.add_paragraph("")  # Empty line
+        _append_paragraphs(doc, [f"• {decision}" for decision in decisions])
     
     # Action Items
     action_items = data.get('actionItems', [])
@@ -7,96 +7,97 @@ from reportlab.lib.units import inch
 from typing import Dict, Any, List
 from datetime import datetime
 
+# Styles never change between renders, so build them once at import
+_STYLES = getSampleStyleSheet()
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    alignment=1  # Center alignment
+)
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=16,
+    spaceAfter=12,
+    textColor=colors.darkblue
+)
+
+def _bullets(lines: List[str]) -> Paragraph:
+    """Render a bullet list as one paragraph so reportlab lays it out once"""
+    return Paragraph("<br/>".join(f"• {line}" for line in lines), _STYLES['Normal'])
+
 def generate_pdf(data: Dict[str, Any]) -> BytesIO:
     """Generate PDF document from structured meeting data"""
     buffer = BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=1*inch, bottomMargin=1*inch)
     
-    # Get styles
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
-        alignment=1  # Center alignment
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        spaceAfter=12,
-        textColor=colors.darkblue
-    )
-    
     # Build document content
     story = []
     
     # Title
-    story.append(Paragraph("Meeting Minutes", title_style))
+    story.append(Paragraph("Meeting Minutes", _TITLE_STYLE))
     story.append(Spacer(1, 20))
     
     # Metadata
     processed_at = data.get('processed_at', datetime.utcnow().isoformat())
     model_used = data.get('model_used', 'AI Assistant')
     
-    story.append(Paragraph(f"<b>Generated on:</b> {processed_at}", styles['Normal']))
-    story.append(Paragraph(f"<b>Processed by:</b> {model_used}", styles['Normal']))
+    story.append(Paragraph(f"<b>Generated on:</b> {processed_at}", _STYLES['Normal']))
+    story.append(Paragraph(f"<b>Processed by:</b> {model_used}", _STYLES['Normal']))
     story.append(Spacer(1, 20))
     
     # Participants
     participants = data.get('participants', [])
     if participants:
-        story.append(Paragraph("Participants", heading_style))
-        for participant in participants:
-            story.append(Paragraph(f"• {participant}", styles['Normal']))
+        story.append(Paragraph("Participants", _HEADING_STYLE))
+        story.append(_bullets(participants))
         story.append(Spacer(1, 15))
     
     # Summary
     summary = data.get('summary', [])
     if summary:
-        story.append(Paragraph("Summary", heading_style))
+        story.append(Paragraph("Summary", _HEADING_STYLE))
         if isinstance(summary, list):
-            for point in summary:
-                story.append(Paragraph(f"• {point}", styles['Normal']))
+            story.append(_bullets(summary))
         else:
-            story.append(Paragraph(str(summary), styles['Normal']))
+            story.append(Paragraph(str(summary), _STYLES['Normal']))
         story.append(Spacer(1, 15))
     
     # Agenda Items
     agenda = data.get('agenda', [])
     if agenda:
-        story.append(Paragraph("Agenda Items", heading_style))
-        for item in agenda:
-            story.append(Paragraph(f"• {item}", styles['Normal']))
+        story.append(Paragraph("Agenda Items", _HEADING_STYLE))
+        story.append(_bullets(agenda))
         story.append(Spacer(1, 15))
     
     # Topics Discussed
     topics = data.get('topics', [])
     if topics:
-        story.append(Paragraph("Topics Discussed", heading_style))
+        story.append(Paragraph("Topics Discussed", _HEADING_STYLE))
+        lines = []
         for topic in topics:
             if isinstance(topic, dict):
                 topic_name = topic.get('topic', '')
                 confidence = topic.get('confidence', 0)
-                story.append(Paragraph(f"• {topic_name} (Confidence: {confidence:.1%})", styles['Normal']))
+                lines.append(f"{topic_name} (Confidence: {confidence:.1%})")
             else:
-                story.append(Paragraph(f"• {topic}", styles['Normal']))
+                lines.append(str(topic))
+        story.append(_bullets(lines))
         story.append(Spacer(1, 15))
     
     # Decisions Made
     decisions = data.get('decisions', [])
     if decisions:
-        story.append(Paragraph("Decisions Made", heading_style))
-        for decision in decisions:
-            story.append(Paragraph(f"• {decision}", styles['Normal']))
+        story.append(Paragraph("Decisions Made", _HEADING_STYLE))
+        story.append(_bullets(decisions))
         story.append(Spacer(1, 15))
     
     # Action Items
     action_items = data.get('actionItems', [])
     if action_items:
-        story.append(Paragraph("Action Items", heading_style))
+        story.append(Paragraph("Action Items", _HEADING_STYLE))
         
         # Create table data
         table_data = [['Task', 'Owner', 'Deadline', 'Status']]
@@ -0,0 +1,74 @@
+import random
+import re
+
+import pytest
+
+pytest.importorskip("emergentintegrations")
+pytest.importorskip("hyperscan")
+
+from services import ai_service
+from services.ai_service import (
+    AIService, _ACTION_KEYWORDS, _HYPERSCAN_MIN_LENGTH, _KEYWORD_FOLDS,
+)
+
+TOKENS = [
+    "Alice", "Bob Smith", "will", "should", "needs to", "must", "agreed to",
+    "committed to", "fix", "the", "build", ".", " .", "..", "\n", "\t",
+    "\xa0", " ", "é", "ſhould", "Kelvin", "42", "WILL", "Agreed To",
+    "\ud800", "Carol\xa0will", "Dan\xa0must\xa0", "wıll", "commİtted to", "muſt",
+]
+
+
+def _transcript(rng):
+    parts = []
+    while sum(map(len, parts)) <= _HYPERSCAN_MIN_LENGTH:
+        parts.append(rng.choice(TOKENS))
+        parts.append(rng.choice(" \n."))
+    return "".join(parts)
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_hyperscan_prefilter_matches_plain_scan(seed, monkeypatch):
+    svc = AIService.__new__(AIService)
+    transcript = _transcript(random.Random(seed))
+    assert len(transcript) > _HYPERSCAN_MIN_LENGTH
+
+    with_hyperscan = svc._extract_action_items_fallback(transcript)
+    monkeypatch.setattr(ai_service, "hyperscan", None)
+    without_hyperscan = svc._extract_action_items_fallback(transcript)
+
+    assert with_hyperscan
+    assert with_hyperscan == without_hyperscan
+
+
+def test_keyword_folds_cover_unicode_ignorecase():
+    letters = "".join(sorted(set("".join(_ACTION_KEYWORDS).replace(" ", ""))))
+    letter_re = re.compile(f"[{letters}]", re.IGNORECASE)
+    folds = {}
+    for code in range(0x80, 0x110000):
+        char = chr(code)
+        if letter_re.fullmatch(char):
+            for letter in letters:
+                if re.fullmatch(letter, char, re.IGNORECASE):
+                    folds[letter] = folds.get(letter, "") + char
+
+    assert folds == _KEYWORD_FOLDS
+
+
+def test_action_items_allow_unicode_whitespace():
+    svc = AIService.__new__(AIService)
+
+    items = svc._extract_action_items_fallback("Bob\xa0will fix it.")
+
+    assert [(item["owner"], item["task"]) for item in items] == [("Bob", "fix it")]
+
+
+def test_long_transcript_with_lone_surrogate():
+    svc = AIService.__new__(AIService)
+    transcript = "Bob will fix it. " * 1500 + "Eve must ship \ud800 today"
+    assert len(transcript) > _HYPERSCAN_MIN_LENGTH
+
+    items = svc._extract_action_items_fallback(transcript)
+
+    assert len(items) == 1501
+    assert items[-1]["task"] == "ship \ud800 today"
@@ -0,0 +1,31 @@
+import pytest
+
+pytest.importorskip("docx")
+
+from docx import Document
+from lxml import etree
+
+from services.doc_service import _append_paragraphs
+
+
+def _body_xml(doc):
+    body = doc.element.body
+    return [etree.tostring(el) for el in body if el is not body.sectPr]
+
+
+@pytest.mark.parametrize("lines", [
+    ["• plain"],
+    ["• Bob & <Co>", " leading and trailing "],
+    ["• a\nb\tc", "line\r\nbreak", "\n", "\t", "tail\t"],
+])
+def test_append_paragraphs_matches_add_paragraph(lines):
+    expected = Document()
+    for line in lines:
+        expected.add_paragraph(line)
+    expected.add_paragraph("")
+
+    actual = Document()
+    _append_paragraphs(actual, lines)
+
+    assert _body_xml(actual) == _body_xml(expected)
+    assert actual.element.body[-1] is actual.element.body.sectPr